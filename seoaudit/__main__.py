@@ -16,19 +16,13 @@ def main():
 
     # Load the configuration file
     if args.config:
-        import importlib
-        import os
+        from seoaudit.config_loader import load_config
 
         try:
-            module_name = args.config
-            module_file_path = os.path.abspath(os.getcwd()) + "\\" + module_name + ".py"
-            module_spec = importlib.util.spec_from_file_location(
-                module_name, module_file_path)
-            cfg = importlib.util.module_from_spec(module_spec)
-            module_spec.loader.exec_module(cfg)
+            cfg = load_config(args.config)
 
             print("Using config file {}".format(args.config))
-        except ImportError as err:
+        except (ImportError, OSError) as err:
             print('Error:', err)
     else:
         import seoaudit.config as cfg
@@ -48,7 +42,7 @@ def main():
 
     print("-----------------------")
     print("SEO Auditor finished.")
-    print("Results stored in: {} and {}".format(auditer.result_filename, auditer.result_filename.replace('.json',
+    print("Results stored in: {} and {}".format(auditer.result_filename, auditer.result_filename.replace('.jsonl',
                                                                                                          '.html')))
 
 
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+This module contains the shared requests Session used for all of the analyzer's HTTP fetches.
+
+Routing every GET through a single session enables keep-alive and urllib3 connection pooling, so a crawl
+of multiple pages on the same host reuses already opened TCP/TLS connections instead of paying a new
+handshake per request.
+
+Site-level resources that rarely change between audits (sitemap, web app manifest, browser config) can be
+fetched through fetch_cached which memoizes response bodies on disk with a TTL and revalidates with
+conditional GETs (If-None-Match/If-Modified-Since), so repeat audits skip redundant downloads.
+
+Typical usage example:
+
+    from seoaudit.analyzer.http import SESSION, fetch_cached
+    page = SESSION.get(url)
+    sitemap_bytes = fetch_cached(sitemap_url)
+
+"""
+
+import hashlib
+import os
+import pickle
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = 'seoaudit'
+
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=Retry(total=2))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'seoaudit')
+
+# time in seconds before a cached response has to be revalidated with a conditional GET
+CACHE_TTL = 30 * 60
+
+
+def _cache_path(url):
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.pkl')
+
+
+def fetch_cached(url):
+    """
+    GET a url with the response body memoized on disk.
+
+    A cached body younger than CACHE_TTL is returned without touching the network; an older one is
+    revalidated with If-None-Match/If-Modified-Since headers so an unchanged resource only costs a 304.
+
+    Args:
+        url (str): url to fetch
+
+    Returns:
+        bytes : response body
+    """
+    entry = None
+    try:
+        with open(_cache_path(url), 'rb') as fp:
+            entry = pickle.load(fp)
+    except (OSError, pickle.PickleError, EOFError):
+        pass
+
+    if entry is not None and time.time() - entry['fetched_at'] < CACHE_TTL:
+        return entry['content']
+
+    headers = {}
+    if entry is not None:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    r = SESSION.get(url, headers=headers)
+
+    if r.status_code == 304 and entry is not None:
+        content = entry['content']
+    elif r.status_code == 200:
+        content = r.content
+    else:
+        # never persist error bodies: a transient 404/500 page would otherwise be served as the
+        # resource for every audit until the TTL expires
+        return r.content
+
+    entry = {'fetched_at': time.time(), 'etag': r.headers.get('ETag'),
+             'last_modified': r.headers.get('Last-Modified'), 'content': content}
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(_cache_path(url), 'wb') as fp:
+            pickle.dump(entry, fp)
+    except OSError:
+        pass
+
+    return content
+
+
+def clear_cache():
+    """ Remove all cached responses from the on-disk cache. """
+    try:
+        for filename in os.listdir(CACHE_DIR):
+            if filename.endswith('.pkl'):
+                os.remove(os.path.join(CACHE_DIR, filename))
+    except OSError:
+        pass
@@ -11,16 +11,48 @@ Typical usage example:
 """
 
 import abc
+import functools
+import re
+
 from w3lib.html import get_base_url
 
 from selenium.webdriver.remote.webdriver import WebElement
 import selenium.webdriver
 from selenium.common.exceptions import NoSuchElementException
 
-import requests
 import lxml.html
 import lxml.etree
 
+from seoaudit.analyzer.http import SESSION
+
+# precompiled whitespace run matcher used to normalize whitespace without building intermediate token lists
+_WS = re.compile(r'\s+')
+
+# shared tuned parser: drops comment/blank-text nodes the checks never look at and skips id hashing
+_HTML_PARSER = lxml.html.HTMLParser(remove_comments=True, remove_blank_text=True, collect_ids=False,
+                                    huge_tree=True)
+
+# fixed head meta/link query shapes used throughout the configs, served from the single-pass head dicts
+_HEAD_META_QUERY = re.compile(r"^\(?/html/head/meta\[@(name|property)='([^']+)'\]\)?$")
+_HEAD_LINK_QUERY = re.compile(r"^\(?/html/head/link\[@rel='([^']+)'\]\)?$")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_xpath(xpath_query: str):
+    """
+    Compile an xpath query string into a reusable lxml.etree.XPath object.
+
+    The auditor runs the same fixed set of queries against every page, so compiling each query once and
+    caching it removes the per-call xpath parse overhead.
+
+    Args:
+        xpath_query (str): xpath elements query
+
+    Returns:
+        lxml.etree.XPath : compiled xpath evaluator
+    """
+    return lxml.etree.XPath(xpath_query)
+
 
 class AbstractPageParser(metaclass=abc.ABCMeta):
     """ Abstract web page parser. Used as a blueprint for page parser implementations. """
@@ -47,6 +79,18 @@ class AbstractPageParser(metaclass=abc.ABCMeta):
         """
         pass
 
+    def get_element_count(self, xpath_query: str) -> int:
+        """
+        Count HTML elements matching the xpath query on the parsed web page.
+
+        Args:
+            xpath_query (str): xpath elements query
+
+        Returns:
+            int : number of matching elements
+        """
+        return len(self.get_elements(xpath_query))
+
     @abc.abstractmethod
     def get_element_code(self, element) -> str:
         """
@@ -87,6 +131,19 @@ class AbstractPageParser(metaclass=abc.ABCMeta):
         """
         pass
 
+    def get_elements_attributes(self, xpath_query: str, attribute="textContent") -> list:
+        """
+        Get the attribute value of every element matching the xpath query, aligned with get_elements.
+
+        Args:
+            xpath_query (str): xpath elements query
+            attribute: attribute name, defaults to textContent
+
+        Returns:
+            list of attribute text values, None entries for elements missing the attribute
+        """
+        return [self.get_element_attribute(element, attribute) for element in self.get_elements(xpath_query)]
+
 
 class SeleniumPageParser(AbstractPageParser):
     """ Web page parser with Selenium Webdriver core.
@@ -108,7 +165,7 @@ class SeleniumPageParser(AbstractPageParser):
 
         self.text = self.get_element_text(self.get_elements("/*")[0])
         self.base_url = get_base_url(self.text, url)
-        self.source = " ".join(self.__driver.page_source.split())
+        self.source = _WS.sub(' ', self.__driver.page_source).strip()
         self.title = self.__driver.title
 
         description_el = self.get_elements("(/html/head/meta[@name='description'])")
@@ -124,13 +181,15 @@ class SeleniumPageParser(AbstractPageParser):
 
         Returns: a list of selenium Webdriver elements
         """
-        if "/@" in xpath_query:
-            query_attribute = xpath_query.split("/@")[1]
-            xpath_query = xpath_query.split("/@")[0]
+        # precompiled lxml XPath objects carry their expression string in .path
+        xpath_query = getattr(xpath_query, 'path', xpath_query)
+
+        element_query, separator, query_attribute = xpath_query.partition("/@")
 
+        if separator:
             try:
                 return [element.get_attribute(query_attribute) for element in
-                        self.__driver.find_elements_by_xpath(xpath_query)]
+                        self.__driver.find_elements_by_xpath(element_query)]
             except NoSuchElementException:
                 return None
         else:
@@ -149,7 +208,7 @@ class SeleniumPageParser(AbstractPageParser):
         Returns:
             string HTML code
         """
-        return " ".join(element.get_attribute('outerHTML').split())
+        return _WS.sub(' ', element.get_attribute('outerHTML')).strip()
 
     def get_element_text(self, element) -> str:
         """
@@ -164,7 +223,7 @@ class SeleniumPageParser(AbstractPageParser):
             string text content
         """
         if hasattr(element, 'text'):
-            return " ".join(str(element.text).split())
+            return _WS.sub(' ', str(element.text)).strip()
         elif isinstance(element, str):
             return element
 
@@ -188,20 +247,119 @@ class SeleniumPageParser(AbstractPageParser):
 class LXMLPageParser(AbstractPageParser):
     """ Web page parser with lxml core. """
 
-    def __init__(self, url):
+    def __init__(self, url, page_text=None, tree=None):
+        """
+
+        Args:
+            url (str): url of the web page to be parsed
+            page_text (str | bytes): optional pre-fetched HTML of the page, if not given the page is fetched from url
+            tree: optional already parsed lxml tree of page_text, if given page_text is only used for the source string
+        """
         super().__init__(url)
-        page = requests.get(url)
 
-        self.__tree = lxml.html.fromstring(page.text)
-        self.source = " ".join(page.text.split())
+        if page_text is None:
+            # fetch raw bytes so libxml2 sniffs the encoding in C instead of decoding in Python first
+            page_text = SESSION.get(url).content
+
+        if tree is not None:
+            self.__tree = tree
+        else:
+            self.__tree = lxml.html.fromstring(page_text, parser=_HTML_PARSER)
+
+        # drop script/style subtrees once in a single C-level traversal so text extraction doesn't have to
+        # find and drop them again on every call
+        lxml.etree.strip_elements(self.__tree, 'script', 'style', with_tail=False)
+
+        # per-page xpath result cache; the tree is immutable for the page lifetime so identical queries
+        # issued by different checks only evaluate once
+        self._xpath_cache = {}
+
+        if isinstance(page_text, bytes):
+            # decode with the charset libxml2 detected while parsing, so non-UTF8 pages keep their text
+            # intact in source (which feeds extruct and the text-to-code ratio)
+            encoding = self.__tree.getroottree().docinfo.encoding or 'utf-8'
+            try:
+                page_text = page_text.decode(encoding, errors='replace')
+            except LookupError:
+                page_text = page_text.decode('utf-8', errors='replace')
+        self.source = _WS.sub(' ', page_text).strip()
         self.text = self.get_element_text(self.get_elements("/*")[0])
         self.base_url = get_base_url(self.text, url)
-        title_el = self.get_elements("/html/head/title")
-        title_el = title_el[0] if len(title_el) >= 1 else None
-        self.title = self.get_element_text(title_el)
-        description_el = self.get_elements("(/html/head/meta[@name='description'])")
-        description_el = description_el[0] if len(description_el) >= 1 else None
-        self.description = self.get_element_attribute(description_el, "content")
+
+        # collect title, meta and link head elements in a single pass instead of one xpath traversal each
+        self._head_title = None
+        self._head_meta = {}
+        self._head_meta_property = {}
+        self._head_links = {}
+
+        head = self.__tree.find('head')
+        if head is not None:
+            for el in head.iter('title', 'meta', 'link'):
+                if el.tag == 'title' and self._head_title is None:
+                    self._head_title = el
+                elif el.tag == 'meta':
+                    name = el.get('name')
+                    if name:
+                        self._head_meta.setdefault(name, []).append(el)
+                    meta_property = el.get('property')
+                    if meta_property:
+                        self._head_meta_property.setdefault(meta_property, []).append(el)
+                elif el.tag == 'link':
+                    rel = el.get('rel')
+                    if rel:
+                        self._head_links.setdefault(rel, []).append(el)
+
+        self.title = self.get_element_text(self._head_title)
+        description_els = self._head_meta.get('description')
+        self.description = self.get_element_attribute(description_els[0] if description_els else None, "content")
+
+    @classmethod
+    def from_url(cls, url):
+        """
+        Create a parser by fetching and parsing the page found on the given url. The response body is
+        streamed into a feed parser so parsing overlaps with the download instead of waiting for it.
+
+        Args:
+            url (str): url of the web page to be parsed
+
+        Returns:
+            LXMLPageParser : parser object of the fetched page
+        """
+        # feed parsers are stateful so a fresh one is needed per document
+        feed_parser = lxml.html.HTMLParser(remove_comments=True, remove_blank_text=True, collect_ids=False,
+                                           huge_tree=True)
+        chunks = []
+
+        with SESSION.get(url, stream=True) as response:
+            for chunk in response.iter_content(65536):
+                chunks.append(chunk)
+                feed_parser.feed(chunk)
+
+        return cls(url, page_text=b"".join(chunks), tree=feed_parser.close())
+
+    @classmethod
+    def from_bytes(cls, url, page_bytes):
+        """
+        Create a parser from already fetched raw HTML bytes (e.g. from SiteParser's async prefetcher),
+        skipping the fetch inside the constructor.
+
+        Args:
+            url (str): url of the web page the bytes were fetched from
+            page_bytes (bytes): raw HTML body of the page
+
+        Returns:
+            LXMLPageParser : parser object of the given page
+        """
+        return cls(url, page_text=page_bytes)
+
+    def close(self):
+        """
+        Release the parsed tree and page source once all checks for the page have run, so a long crawl
+        doesn't pin the memory of every page it has already audited.
+        """
+        self.__tree = None
+        self.source = None
+        self._xpath_cache.clear()
 
     def get_elements(self, xpath_query: str):
         """
@@ -210,9 +368,62 @@ class LXMLPageParser(AbstractPageParser):
         Args:
             xpath_query (str): xpath elements query
 
+        Accepts either a query string or a precompiled lxml.etree.XPath object (as produced by the configs),
+        skipping the compile step entirely for the latter.
+
         Returns: a list of lxml HtmlElement elements
         """
-        return self.__tree.xpath(xpath_query)
+        try:
+            return self._xpath_cache[xpath_query]
+        except KeyError:
+            if isinstance(xpath_query, str):
+                result = self._lookup_head_query(xpath_query)
+                if result is None:
+                    result = _compile_xpath(xpath_query)(self.__tree)
+            else:
+                result = self._lookup_head_query(xpath_query.path)
+                if result is None:
+                    result = xpath_query(self.__tree)
+            self._xpath_cache[xpath_query] = result
+            return result
+
+    def _lookup_head_query(self, xpath_query: str):
+        """
+        Serve the fixed head meta/link query shapes used by the configs from the dicts built during the
+        single head pass, avoiding an xpath traversal per query.
+
+        Args:
+            xpath_query (str): xpath elements query
+
+        Returns:
+            list of matching head elements, or None if the query is not a recognized head lookup
+        """
+        match = _HEAD_META_QUERY.match(xpath_query)
+        if match:
+            lookup = self._head_meta if match.group(1) == 'name' else self._head_meta_property
+            return list(lookup.get(match.group(2), ()))
+
+        match = _HEAD_LINK_QUERY.match(xpath_query)
+        if match:
+            return list(self._head_links.get(match.group(1), ()))
+
+        return None
+
+    def get_element_count(self, xpath_query: str) -> int:
+        """
+        Count HTML elements matching the xpath query on the parsed web page.
+
+        Counting runs through xpath's count() entirely inside libxml2, so no Python list of per-node
+        objects is materialized.
+
+        Args:
+            xpath_query (str): xpath elements query
+
+        Returns:
+            int : number of matching elements
+        """
+        xpath_query = getattr(xpath_query, 'path', xpath_query)
+        return int(_compile_xpath("count(" + xpath_query + ")")(self.__tree))
 
     def get_element_code(self, element) -> str:
         """
@@ -224,7 +435,7 @@ class LXMLPageParser(AbstractPageParser):
         Returns:
             string HTML code
         """
-        return " ".join(str(lxml.etree.tostring(element)).split())
+        return _WS.sub(' ', str(lxml.etree.tostring(element))).strip()
 
     def get_element_text(self, element) -> str:
         """
@@ -238,11 +449,9 @@ class LXMLPageParser(AbstractPageParser):
         Returns:
             string text content
         """
-        # remove all script elements from the tree
-        if hasattr(element, 'findall') and hasattr(element, 'text_content'):
-            [script_tag.drop_tree() for script_tag in element.findall('.//script')]
-            [style_tag.drop_tree() for style_tag in element.findall('.//style')]
-            return " ".join(str(element.text_content()).split())
+        # script/style subtrees are already stripped from the tree at parse time
+        if hasattr(element, 'text_content'):
+            return _WS.sub(' ', str(element.text_content())).strip()
         elif isinstance(element, str):
             return element
 
@@ -265,3 +474,23 @@ class LXMLPageParser(AbstractPageParser):
         else:
             content = element.get(attribute)
         return content if content else None
+
+    def get_elements_attributes(self, xpath_query: str, attribute="textContent") -> list:
+        """
+        Get the attribute value of every element matching the xpath query, aligned with get_elements.
+
+        The matching elements come from the per-page xpath cache, so the whole extraction is one cached
+        query plus a single comprehension over C-level attribute lookups instead of a method call with
+        attribute-name branching per element.
+
+        Args:
+            xpath_query (str): xpath elements query
+            attribute: attribute name, defaults to textContent
+
+        Returns:
+            list of attribute text values, None entries for elements missing the attribute
+        """
+        elements = self.get_elements(xpath_query)
+        if attribute == "textContent":
+            return [element.text or None for element in elements]
+        return [element.get(attribute) or None for element in elements]
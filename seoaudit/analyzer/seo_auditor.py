@@ -17,10 +17,42 @@ Todo:
     * output results as html
 """
 
+import asyncio
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from json2html import *
 
+# orjson serializes nested result dicts several times faster than stdlib json; fall back when unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_results(results, indent=False):
+    """
+    Serialize a results object to a JSON string, using orjson when installed.
+
+    Args:
+        results: JSON-serializable results object
+        indent (bool): pretty-print the output
+
+    Returns:
+        str : JSON representation of results
+    """
+    if orjson is not None:
+        # orjson has no native tuple support; check results and arguments may contain tuples.
+        # OPT_NON_STR_KEYS matches stdlib json's key coercion: repetition checks return dicts keyed by
+        # page metadata values, which are None for pages missing the metadata
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(results, default=list, option=option).decode('utf-8')
+
+    return json.dumps(results, indent=4 if indent else None)
+
 from seoaudit.checks.element import ElementCheck, AbstractElementCheck, check_content
 from seoaudit.checks.site import SiteCheck, check_site
 from seoaudit.checks.page import PageCheck, check_page
@@ -35,7 +67,12 @@ class SEOAuditor(object):
         self.__site_parser = site_parser
         self.__results = {}
         self.__checks = {"page_checks": page_checks, "element_checks": element_checks}
-        self.result_filename = 'seo_audit_' + str(time.time()) + '.json'
+        # check type to handler dispatch table, replaces per-check isinstance chains in run_check
+        self.__dispatch = {SiteCheck: self._run_site_check, PageCheck: self._run_page_check,
+                           ElementCheck: self._run_element_check}
+        self.__results_lock = threading.Lock()
+        self.__executor = None
+        self.result_filename = 'seo_audit_' + str(time.time()) + '.jsonl'
 
     def run_check(self, check, kwargs=None):
         """
@@ -47,17 +84,29 @@ class SEOAuditor(object):
         """
         kwargs = {} if kwargs is None else kwargs
 
-        if isinstance(check, SiteCheck):
-            self.append_result(check_site(check, self.__site_parser, **kwargs), check.name, self.__url, str(kwargs))
-        elif isinstance(check, PageCheck):
-            self.append_result(check_page(check, self.__site_parser.page_parser, **kwargs), check.name, self.__url,
-                               str(kwargs))
-        # Todo: transfer eun_elements_check logic here
-        elif isinstance(check, ElementCheck):
-            check_function = check_content
-        else:
+        try:
+            handler = self.__dispatch[type(check)]
+        except KeyError:
             raise ValueError("check must be of type SiteCheck, PageCheck or ElementCheck.")
 
+        handler(check, kwargs)
+
+    def _run_site_check(self, check, kwargs):
+        """ Runs a SiteCheck and appends its result. """
+        self.append_result(check_site(check, self.__site_parser, **kwargs), check.name, self.__url, str(kwargs))
+
+    def _run_page_check(self, check, kwargs):
+        """ Runs a PageCheck and appends its result. """
+        self.append_result(check_page(check, self.__site_parser.page_parser, **kwargs), check.name, self.__url,
+                           str(kwargs))
+
+    def _run_element_check(self, check, kwargs):
+        """ Placeholder for running an ElementCheck through run_check.
+
+        Todo: transfer run_elements_check logic here
+        """
+        pass
+
     def run_elements_check(self, query, content_attribute='textContent', checks=()):
         """
         Runs element check and appends it's return value to results list.
@@ -71,11 +120,14 @@ class SEOAuditor(object):
         elements = self.__site_parser.page_parser.get_elements(query)
 
         if len(elements) == 0:
-            self.append_result(False, "ELEMENT_FOUND", query, None)
+            # report the expression string when the query is a precompiled lxml XPath object
+            self.append_result(False, "ELEMENT_FOUND", getattr(query, 'path', query), None)
             return
 
-        for element in elements:
-            content = self.__site_parser.page_parser.get_element_attribute(element, content_attribute)
+        # extract all attribute values in one batched pass instead of a parser call per element
+        contents = self.__site_parser.page_parser.get_elements_attributes(query, content_attribute)
+
+        for element, content in zip(elements, contents):
             element_str = self.__site_parser.page_parser.get_element_code(element)
             element_str = (element_str[:150] + '..') if len(element_str) > 150 else element_str
 
@@ -101,48 +153,79 @@ class SEOAuditor(object):
             kwargs: check's keyword arguments
 
         """
-        if self.__site_parser.get_current_url() not in self.__results.keys():
-            self.__results[self.__site_parser.get_current_url()] = []
+        with self.__results_lock:
+            if self.__site_parser.get_current_url() not in self.__results.keys():
+                self.__results[self.__site_parser.get_current_url()] = []
 
-        self.__results[self.__site_parser.get_current_url()].append(
-            {"result": result, "check": check, "check_arguments": kwargs,
-             "audited_object": audited_object})
+            self.__results[self.__site_parser.get_current_url()].append(
+                {"result": result, "check": check, "check_arguments": kwargs,
+                 "audited_object": audited_object})
 
     def get_results(self):
         """ Get results list. """
         return self.__results
 
+    def to_json(self):
+        """ Serialize all collected results into a single JSON object string. """
+        return _dump_results(self.__results, indent=True)
+
     def clear_results(self):
         """ Clear results dict. """
         self.__results = {}
 
     def run_checks_for_current_page(self):
-        """ Runs predefined page and element checks. """
+        """ Runs predefined page and element checks.
 
-        for test in self.__checks["page_checks"]:
-            self.run_check(*test)
+        Checks run on a thread pool: lxml releases the GIL while evaluating xpath on the underlying C tree,
+        so independent checks on the same page overlap. Result writes stay serialized by append_result's lock.
+        """
+
+        executor = self._get_executor()
+        list(executor.map(lambda test: self.run_check(*test), self.__checks["page_checks"]))
+        list(executor.map(lambda test: self.run_elements_check(*test), self.__checks["element_checks"]))
 
-        for test in self.__checks["element_checks"]:
-            self.run_elements_check(*test)
+        # all checks for this page have run, release its parse tree and source
+        page_parser = self.__site_parser.page_parser
+        if hasattr(page_parser, 'close'):
+            page_parser.close()
+
+    def _get_executor(self):
+        """ Lazily create the check executor, shared across all pages of a run instead of spinning up and
+        tearing down a thread pool per page. """
+        if self.__executor is None:
+            self.__executor = ThreadPoolExecutor(max_workers=8)
+        return self.__executor
 
     def run_checks_for_site(self):
         """ Runs predefined site checks. """
 
-        print("Running checks for url: {}".format(self.__site_parser.get_current_url()))
-        self.run_checks_for_current_page()
+        # pre-fetch all pages concurrently so parse_next_page() doesn't block on the network per url
+        asyncio.run(self.__site_parser.prefetch_all())
 
+        # results are appended as JSON Lines (one url object per line) so each page only serializes its own
+        # results instead of re-dumping everything audited so far. Each record only covers the current
+        # pass: a url can be audited more than once (the base url also appears in the sitemap), so the
+        # per-url list is sliced from its pre-pass length to keep earlier passes off the new line
         with open(self.result_filename, 'w') as fp:
-            fp.seek(0)
-            json.dump(self.__results, fp, indent=4)
+            url = self.__site_parser.get_current_url()
+            print("Running checks for url: {}".format(url))
+            start = len(self.__results.get(url, []))
+            self.run_checks_for_current_page()
+            fp.write(_dump_results({url: self.__results.get(url, [])[start:]}) + "\n")
 
             while self.__site_parser.parse_next_page():
-                print("Running checks for url: {}".format(self.__site_parser.get_current_url()))
+                url = self.__site_parser.get_current_url()
+                print("Running checks for url: {}".format(url))
+                start = len(self.__results.get(url, []))
                 self.run_checks_for_current_page()
-                fp.seek(0)
-                json.dump(self.__results, fp, indent=4)
+                fp.write(_dump_results({url: self.__results.get(url, [])[start:]}) + "\n")
+
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
 
-            with open(self.result_filename.replace('.json','.html'), 'w', encoding="utf-8") as f:
-                f.write(json2html.convert(json.dumps(self.__results, indent=4)))
+        with open(self.result_filename.replace('.jsonl', '.html'), 'w', encoding="utf-8") as f:
+            f.write(json2html.convert(self.to_json()))
 
 
 
@@ -14,11 +14,17 @@ Todo:
 
 """
 
+import asyncio
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import aiohttp
 import lxml.etree
-import requests
 import urllib.robotparser
 import urllib.parse
 
+from seoaudit.analyzer.http import fetch_cached
 from seoaudit.analyzer.page_parser import AbstractPageParser, LXMLPageParser
 
 
@@ -56,62 +62,114 @@ class SiteParser(object):
 
         self.sitemap_urls = []
 
-        # crawl sitemap referenced by head link[@rel='sitemap'] metadata of base url
+        # look up the sitemap, manifest and browserconfig references on the base page first so their
+        # fetches (plus robots.txt) can be fired concurrently; startup latency drops from the sum of the
+        # round-trips to the slowest one
         if sitemap_link is None:
             sitemap_link = self.page_parser.get_elements("(/html/head/link[@rel='sitemap'])/@href")
             sitemap_link = sitemap_link[0] if len(sitemap_link) >= 1 else None
 
-        if sitemap_link is not None:
-            r = requests.get(urllib.parse.urljoin(self.base_url, sitemap_link))
+        manifest_link = self.page_parser.get_elements("(/html/head/link[@rel='manifest'])/@href")
+        manifest_link = manifest_link[0] if len(manifest_link) >= 1 else None
+
+        browserconfig_link = self.page_parser.get_elements("(/html/head/meta[@name='msapplication-config'])/@content")
+        browserconfig_link = browserconfig_link[0] if len(browserconfig_link) >= 1 else None
+
+        self.robort_parser = urllib.robotparser.RobotFileParser()
+        self.robort_parser.set_url(base_url + "/robots.txt")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sitemap_future = executor.submit(
+                fetch_cached, urllib.parse.urljoin(self.base_url, sitemap_link)) \
+                if sitemap_link is not None else None
+            robots_future = executor.submit(self.robort_parser.read)
+            manifest_future = executor.submit(
+                fetch_cached, urllib.parse.urljoin(self.base_url, manifest_link)) \
+                if manifest_link is not None else None
+            browserconfig_future = executor.submit(
+                fetch_cached, urllib.parse.urljoin(self.base_url, browserconfig_link)) \
+                if browserconfig_link is not None else None
+
+        # crawl sitemap referenced by head link[@rel='sitemap'] metadata of base url
+        if sitemap_future is not None:
+            content = sitemap_future.result()
             try:
-                self.sitemap = lxml.etree.fromstring(r.content)
+                # stream the sitemap with iterparse and clear processed entries to keep memory bounded
+                context = lxml.etree.iterparse(io.BytesIO(content), tag='{*}url')
+
+                for _, sitemap_el in context:
+                    loc = sitemap_el.findtext('{*}loc')
 
-                if parse_sitemap_urls:
-                    for sitemap_el in self.sitemap:
-                        self.urls.append(sitemap_el[0].text)
-                        self.sitemap_urls.append(sitemap_el[0].text)
+                    if parse_sitemap_urls and loc is not None:
+                        self.urls.append(loc)
+                        self.sitemap_urls.append(loc)
+
+                    sitemap_el.clear()
+                    while sitemap_el.getprevious() is not None:
+                        del sitemap_el.getparent()[0]
+
+                self.sitemap = context.root
 
             except lxml.etree.XMLSyntaxError:
                 print("xml error")
                 self.sitemap = None
 
+        # set lookup sidesteps a linear sitemap_urls scan in per-page sitemap membership checks
+        self.sitemap_urls_set = frozenset(self.sitemap_urls)
+
         # crawl robots.txt file found in base_url + "/robots.txt"
-        self.robort_parser = urllib.robotparser.RobotFileParser()
-        self.robort_parser.set_url(base_url + "/robots.txt")
-        self.robort_parser.read()
+        robots_future.result()
 
         if self.robort_parser.entries == 0:
             self.robort_parser = None
 
         # crawl web app manifest file referenced by head link[@rel='manifest'] metadata of base url
-        manifest_link = self.page_parser.get_elements("(/html/head/link[@rel='manifest'])/@href")
-        manifest_link = manifest_link[0] if len(manifest_link) >= 1 else None
-
-        if manifest_link is not None:
-            self.web_app_manifest = requests.get(urllib.parse.urljoin(self.base_url, manifest_link))
-            self.web_app_manifest = self.web_app_manifest.json()
-
-        manifest_link = self.page_parser.get_elements("(/html/head/link[@rel='manifest'])/@href")
-        manifest_link = manifest_link[0] if len(manifest_link) >= 1 else None
-
-        if manifest_link is not None:
-            self.web_app_manifest = requests.get(urllib.parse.urljoin(self.base_url, manifest_link))
-            self.web_app_manifest = self.web_app_manifest.json()
+        if manifest_future is not None:
+            self.web_app_manifest = json.loads(manifest_future.result())
 
         # crawl browser config file referenced by head link[@rel='msapplication-config'] metadata of base url
-        browserconfig_link = self.page_parser.get_elements("(/html/head/meta[@name='msapplication-config'])/@content")
-        browserconfig_link = browserconfig_link[0] if len(browserconfig_link) >= 1 else None
-
-        if browserconfig_link is not None:
-            r = requests.get(urllib.parse.urljoin(self.base_url, browserconfig_link))
+        if browserconfig_future is not None:
+            content = browserconfig_future.result()
             try:
-                self.browserconfig = lxml.etree.fromstring(r.content)
+                self.browserconfig = lxml.etree.fromstring(content)
 
             except lxml.etree.XMLSyntaxError:
                 self.browserconfig = None
 
-        # sites cache is used in site checks (e.g. Site_Check.TITLE_REPETITION)
-        self.sites_cache = []
+        # sites cache is used in site checks (e.g. Site_Check.TITLE_REPETITION); parallel lists per field
+        # so repetition scans iterate one contiguous list instead of chasing a dict per page
+        self.sites_cache = {"url": [], "title": [], "description": []}
+
+        # urls to pre-fetched page text, filled by prefetch_all()
+        self.prefetched_pages = {}
+
+    async def fetch_all(self, urls):
+        """
+        Fetch HTML text of the given urls concurrently.
+
+        Args:
+            urls: list of urls to fetch
+
+        Returns:
+            dict : map of url to raw fetched page bytes, urls whose fetch failed are left out
+
+        """
+        semaphore = asyncio.Semaphore(50)
+
+        async def fetch(session, url):
+            async with semaphore:
+                async with session.get(url) as response:
+                    return await response.read()
+
+        connector = aiohttp.TCPConnector(limit=50, limit_per_host=4)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            pages = await asyncio.gather(*(fetch(session, url) for url in urls), return_exceptions=True)
+
+        return {url: page for url, page in zip(urls, pages) if isinstance(page, bytes)}
+
+    async def prefetch_all(self):
+        """ Fetch all of the site's urls concurrently and cache their raw bytes for parse_next_page(). """
+        self.prefetched_pages = await self.fetch_all(self.urls)
 
     def parse_next_page(self, ):
         """
@@ -127,12 +185,21 @@ class SiteParser(object):
         if self.current_page_index >= len(self.urls):
             # end of urls list reached
             return False
-        self.page_parser = LXMLPageParser(self.urls[self.current_page_index])
+        url = self.urls[self.current_page_index]
+        # drop the prefetched body once its parser is built so raw page bytes don't accumulate for the
+        # whole crawl
+        page_bytes = self.prefetched_pages.pop(url, None)
+
+        if page_bytes is not None:
+            self.page_parser = LXMLPageParser.from_bytes(url, page_bytes)
+        else:
+            self.page_parser = LXMLPageParser.from_url(url)
 
-        # add to site cache for SiteCheck-s
-        self.sites_cache.append(
-            {"url": self.page_parser.url, "content": self.page_parser.text, "title": self.page_parser.title,
-             "description": self.page_parser.description})
+        # add to site cache for SiteCheck-s; only the short metadata strings the repetition checks consume
+        # are kept, not the full page text, so the cache stays small on large crawls
+        self.sites_cache["url"].append(self.page_parser.url)
+        self.sites_cache["title"].append(self.page_parser.title)
+        self.sites_cache["description"].append(self.page_parser.description)
 
         return True
 
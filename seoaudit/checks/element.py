@@ -21,12 +21,66 @@ Todo:
 
 from enum import Enum
 import abc
+import functools
 import re
+import threading
+
+# optional DFA regex engine for bulk element checks; the stdlib re engine is used when not installed
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# cached hyperscan databases hold a single scratch space, which must not be used by concurrent scans;
+# checks run on a thread pool, so scans are serialized behind this lock
+_HYPERSCAN_SCAN_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=256)
+def _get_pattern(regex: str):
+    """
+    Compile a regex string into a cached re.Pattern.
+
+    The audit config applies the same small set of patterns across every element of every page, so each
+    pattern is compiled once instead of being re-parsed per check invocation.
+
+    Args:
+        regex (str): regular expression string
+
+    Returns:
+        re.Pattern : compiled pattern
+    """
+    return re.compile(regex)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_hyperscan_db(regex: str):
+    """
+    Compile a regex string into a cached Hyperscan database.
+
+    The pattern is anchored at the start to mirror re.match semantics. Patterns using constructs
+    Hyperscan doesn't support yield None, signalling the caller to fall back to the re engine.
+
+    Args:
+        regex (str): regular expression string
+
+    Returns:
+        hyperscan.Database or None : compiled pattern database, None if the pattern isn't supported
+    """
+    db = hyperscan.Database()
+    try:
+        db.compile(expressions=[('^(?:' + regex + ')').encode('utf-8')], ids=[0],
+                   flags=[hyperscan.HS_FLAG_UTF8])
+    except hyperscan.error:
+        return None
+    return db
 
 
 class AbstractElementCheck(metaclass=abc.ABCMeta):
     """ Abstract class that serves as a blueprint for element check classes. """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def check_content(self, content: str, **kwargs):
         """ Returns check validity of the given element.
@@ -44,6 +98,8 @@ class AbstractElementCheck(metaclass=abc.ABCMeta):
 class AttributeFoundCheck(AbstractElementCheck):
     """ Checks if content attribute is found and not empty. """
 
+    __slots__ = ()
+
     def check_content(self, content: str, **unused):
         """
         Args:
@@ -60,6 +116,8 @@ class AttributeFoundCheck(AbstractElementCheck):
 class MinLengthCheck(AbstractElementCheck):
     """ Check if content length is bigger or equal to minimal length. """
 
+    __slots__ = ()
+
     def check_content(self, content: str, **kwargs):
         """
 
@@ -71,6 +129,10 @@ class MinLengthCheck(AbstractElementCheck):
              Tuple(boolean, int): tuple including boolean check result and content length
 
         """
+        # missing attribute content fails the check with a branch instead of a TypeError from len(None)
+        if content is None:
+            return False, 0
+
         min_length = kwargs.get('min_length', 0)
 
         if min_length <= 0:
@@ -82,6 +144,8 @@ class MinLengthCheck(AbstractElementCheck):
 class MaxLengthCheck(AbstractElementCheck):
     """ Check if content length is smaller or equal to maximal length.. """
 
+    __slots__ = ()
+
     def check_content(self, content: str, **kwargs):
         """
         Args:
@@ -92,6 +156,10 @@ class MaxLengthCheck(AbstractElementCheck):
             Tuple(boolean, int): tuple including boolean check result and content length
 
         """
+        # missing attribute content fails the check with a branch instead of a TypeError from len(None)
+        if content is None:
+            return False, 0
+
         max_length = kwargs.get('max_length', 0)
 
         if max_length <= 0:
@@ -101,7 +169,13 @@ class MaxLengthCheck(AbstractElementCheck):
 
 
 class RegexMatchCheck(AbstractElementCheck):
-    """ Implements content regex match check. """
+    """ Implements content regex match check.
+
+    When the optional hyperscan package is installed, matching runs as a single-pass DFA scan instead of
+    the stdlib backtracking engine; patterns hyperscan can't compile fall back to re.
+    """
+
+    __slots__ = ()
 
     def check_content(self, content: str, **kwargs):
         """
@@ -112,8 +186,23 @@ class RegexMatchCheck(AbstractElementCheck):
              Tuple(boolean, int): tuple including boolean check result and content length
 
         """
+        # missing attribute content fails the check with a branch instead of a TypeError in match
+        if content is None:
+            return False
+
         regex = kwargs.get('regex', '.*')
-        return re.match(regex, content)
+
+        if hyperscan is not None:
+            db = _get_hyperscan_db(regex)
+            if db is not None:
+                matched = []
+                with _HYPERSCAN_SCAN_LOCK:
+                    db.scan(content.encode('utf-8'),
+                            match_event_handler=lambda *unused: matched.append(True))
+                return len(matched) > 0
+
+        # coerce the Match object so both engines report the same bool (and the result serializes)
+        return _get_pattern(regex).match(content) is not None
 
 
 class ElementCheck(Enum):
@@ -124,6 +213,10 @@ class ElementCheck(Enum):
     CONTENT_REGEX_MATCH = RegexMatchCheck
 
 
+# check objects are stateless, so a shared instance per check type saves an allocation per invocation
+_CHECK_INSTANCES = {check: check.value() for check in ElementCheck}
+
+
 def check_content(check: ElementCheck, content: str, **kwargs):
     """ Wrapper function to perform a check defined by the given ElementCheck.
 
@@ -135,4 +228,4 @@ def check_content(check: ElementCheck, content: str, **kwargs):
     Returns:
         a boolean value representing checks validity preceded by any extra check result information
     """
-    return check.value().check_content(content, **kwargs)
+    return _CHECK_INSTANCES[check].check_content(content, **kwargs)
@@ -20,6 +20,8 @@ Todo:
 
 from enum import Enum
 import abc
+import functools
+import re
 import sys
 import string
 from nltk import word_tokenize
@@ -29,10 +31,73 @@ import extruct
 
 from seoaudit.analyzer.page_parser import AbstractPageParser
 
+# punctuation strip table built once at import instead of per similarity check
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+
+# word matcher for the fast tokenizer path; run on lowercased text so one alternative suffices
+_WORD_RE = re.compile(r"[a-z]+")
+
+# make sure the punkt tokenizer data is available once at import time, so checks don't pay for the
+# LookupError probe (or hit a surprise download) inside the hot path
+try:
+    nltk.data.find('tokenizers/punkt')
+except LookupError:
+    nltk.download('punkt', quiet=True)
+
+
+@functools.lru_cache(maxsize=4096)
+def _tokenize_short(text: str, use_fast_path: bool):
+    """
+    Tokenize a short text string, memoized per distinct string.
+
+    With use_fast_path the text is tokenized with a single compiled-regex scan instead of the Punkt-based
+    word_tokenize. Boilerplate strings recur across the pages of a crawl, so repeated inputs hit the
+    cache. Returns a tuple so cached values stay immutable. Stop-word filtering and stemming stay outside
+    the cache because stemmer and stop-word objects aren't hashable cache keys.
+
+    Args:
+        text (str): text to tokenize
+        use_fast_path (bool): tokenize with the compiled word regex instead of word_tokenize
+
+    Returns:
+        tuple of str : tokens of the given text
+    """
+    if use_fast_path:
+        return tuple(_WORD_RE.findall(text.lower()))
+
+    return tuple(word_tokenize(text))
+
+
+def _tokenize(text: str, use_fast_path: bool = False):
+    """
+    Tokenize text, memoizing only short strings.
+
+    Long texts — typically whole-document extracts from queries like "/*" — are effectively unique per
+    page, so caching them would pin the full text and token tuple of every audited page in memory with no
+    hit-rate benefit; they are tokenized uncached.
+
+    The caller picks the tokenizer: the regex fast path splits hyphenated and apostrophized words
+    differently from word_tokenize, so texts that will be compared against each other must all be
+    tokenized with the same engine.
+
+    Args:
+        text (str): text to tokenize
+        use_fast_path (bool): tokenize with the compiled word regex instead of word_tokenize
+
+    Returns:
+        tuple of str : tokens of the given text
+    """
+    if len(text) < 2000:
+        return _tokenize_short(text, use_fast_path)
+
+    return tuple(word_tokenize(text))
+
 
 class AbstractPageCheck(metaclass=abc.ABCMeta):
     """ Abstract class that serves as a blueprint for page check classes. """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def check_page(self, parser: AbstractPageParser, **kwargs):
         """ Returns check validity of the given page.
@@ -49,6 +114,8 @@ class AbstractPageCheck(metaclass=abc.ABCMeta):
 class DOMSizeCheck(AbstractPageCheck):
     """ Checks if page DOM size (number of DOM element nodes) is smaller than a given maximal value. """
 
+    __slots__ = ()
+
     def check_page(self, parser: AbstractPageParser, **kwargs):
         """
 
@@ -65,13 +132,16 @@ class DOMSizeCheck(AbstractPageCheck):
         if max_size <= 0:
             return False
 
-        return len(parser.get_elements("//*")) < max_size, len(parser.get_elements("//*"))
+        dom_size = parser.get_element_count("//*")
+        return dom_size < max_size, dom_size
 
 
 class TextToCodeRatioCheck(AbstractPageCheck):
     """ Checks if page Text-to-code (length of visible text divided by length of HTML code) ratio is bigger than a
     given minimal value. """
 
+    __slots__ = ()
+
     def check_page(self, parser: AbstractPageParser, **kwargs):
         """
 
@@ -89,14 +159,17 @@ class TextToCodeRatioCheck(AbstractPageCheck):
 
         text_size = len(parser.text)
         code_size = len(parser.source)
+        ratio = text_size / code_size
 
-        return (text_size / code_size) >= min_ratio, (text_size / code_size)
+        return ratio >= min_ratio, ratio
 
 
 class ElementsSimilarityCheck(AbstractPageCheck):
     """ Checks if first element's most common top keywords are found in second element. Optionally
      first element's keywords are filtered with stopwords and stememed."""
 
+    __slots__ = ()
+
     def check_page(self, parser: AbstractPageParser, **kwargs):
         """
 
@@ -138,45 +211,52 @@ class ElementsSimilarityCheck(AbstractPageCheck):
         element_1 = parser.get_element_text(elements1[0])
         element_2 = parser.get_element_text(elements2[0])
 
-        table = str.maketrans('', '', string.punctuation)
+        # the regex fast path only applies when both sides of the comparison qualify, so one comparison
+        # never mixes token spaces (e.g. "e-commerce" -> "ecommerce" under Punkt vs "e", "commerce")
+        use_fast_path = (len(element_1) < 2000 and element_1.isascii()
+                         and len(element_2) < 2000 and element_2.isascii())
 
-        try:
-            element_1_tokens = [w.lower() for w in word_tokenize(element_1)]
-            element_2_tokens = [w.lower() for w in word_tokenize(element_2)]
-        except LookupError:
-            nltk.download('punkt')
-            element_1_tokens = [w.lower() for w in word_tokenize(element_1)]
-            element_2_tokens = [w.lower() for w in word_tokenize(element_2)]
-
-        # remove all string punctuations
-        element_1_tokens = [w.translate(table) for w in element_1_tokens]
-        element_2_tokens = [w.translate(table) for w in element_2_tokens]
-        # remove remaining tokens that are not alphabetic
-        element_1_words = [word for word in element_1_tokens if word.isalpha()]
-        element_2_words = [word for word in element_2_tokens if word.isalpha()]
-
-        # filter out stop words i stopwords are defined
-        if stop_words and all(isinstance(s, str) for s in stop_words):
-            element_1_words = [w for w in element_1_words if not w in stop_words]
-            element_2_words = [w for w in element_2_words if not w in stop_words]
-
-        # stem words if stemmer object is defined
-        if stemmer and hasattr(stemmer, 'stem'):
-            element_1_words = [stemmer.stem(word) for word in element_1_words]
-            element_2_words = [stemmer.stem(word) for word in element_2_words]
-
-        element_1_dict = Counter(element_1_words)
+        element_1_tokens = _tokenize(element_1, use_fast_path)
+        element_2_tokens = _tokenize(element_2, use_fast_path)
+
+        # only filter stop words if stopwords are defined, only stem if a stemmer object is defined
+        filter_stop_words = bool(stop_words) and all(isinstance(s, str) for s in stop_words)
+        stemmer = stemmer if stemmer and hasattr(stemmer, 'stem') else None
+
+        # frozenset turns each per-token stop-word lookup from a linear list scan into a hash lookup
+        if filter_stop_words:
+            stop_words = frozenset(stop_words)
+
+        def clean(tokens):
+            # lowercase, strip punctuation, drop non-alphabetic tokens and stop words, then stem,
+            # all fused into one pass with no intermediate lists
+            for token in tokens:
+                word = token.lower().translate(_PUNCT_TABLE)
+                if not word.isalpha():
+                    continue
+                if filter_stop_words and word in stop_words:
+                    continue
+                yield stemmer.stem(word) if stemmer else word
+
+        element_2_words = list(clean(element_2_tokens))
+        # set membership makes each keyword lookup O(1) instead of a scan over the second element's words
+        element_2_words_set = set(element_2_words)
+
+        element_1_dict = Counter(clean(element_1_tokens))
+        most_common = element_1_dict.most_common(match_most_common)
 
         # if a keyword from most common first elements that deosnt exist in second element is found return False
-        for w in element_1_dict.most_common(match_most_common):
-            if w[0] not in element_2_words:
-                return False, element_1_dict.most_common(match_most_common), element_2_words
-        return True, element_1_dict.most_common(match_most_common), element_2_words
+        for word, _ in most_common:
+            if word not in element_2_words_set:
+                return False, most_common, element_2_words
+        return True, most_common, element_2_words
 
 
 class ElementsCountCheck(AbstractPageCheck):
     """ Checks if elements count within a given interval. """
 
+    __slots__ = ()
+
     def check_page(self, parser: AbstractPageParser, **kwargs):
         """
         Args:
@@ -195,13 +275,45 @@ class ElementsCountCheck(AbstractPageCheck):
         if query is None or not isinstance(query, str):
             raise ValueError("Argument query must be of type str.")
 
-        elements = parser.get_elements(query)
-        return min_count <= len(elements) <= max_count, len(elements)
+        elements_count = parser.get_element_count(query)
+        return min_count <= elements_count <= max_count, elements_count
 
 
 class StructuredDataFoundCheck(AbstractPageCheck):
     """ Checks if structured data is found in the page content. """
 
+    __slots__ = ()
+
+    @staticmethod
+    def _extract(parser: AbstractPageParser, sd_type):
+        """
+        Extract structured data from the parser's page source, memoized on the parser object.
+
+        extruct re-parses the whole page and runs every extractor on each call, so pages with several
+        structured-data checks would repeat that work; results are cached per requested syntax and only
+        the needed extractor runs when a type is given.
+
+        Args:
+            parser (AbstractPageParser) : HTML page parser object
+            sd_type: structured data syntax to extract, or None for all syntaxes
+
+        Returns:
+            dict : extruct extraction result
+        """
+        cache = getattr(parser, '_extruct_cache', None)
+        if cache is None:
+            cache = parser._extruct_cache = {}
+
+        try:
+            return cache[sd_type]
+        except KeyError:
+            if sd_type:
+                data = extruct.extract(parser.source, base_url=parser.base_url, syntaxes=[sd_type])
+            else:
+                data = extruct.extract(parser.source, base_url=parser.base_url)
+            cache[sd_type] = data
+            return data
+
     def check_page(self, parser: AbstractPageParser, **kwargs):
         """
         If none of the kwargs arguments are set check returns True if any structured data is found.
@@ -219,36 +331,30 @@ class StructuredDataFoundCheck(AbstractPageCheck):
             Tuple(boolean, int): tuple including boolean check result and elements count
 
         """
-        data = extruct.extract(parser.source, base_url=parser.base_url)
-
         sd_type = kwargs.get('type')
         sd_key = kwargs.get('key')
         sd_value = kwargs.get('value')
 
-        if sd_type:
-            data = data[sd_type]
-
-            for data_element in data:
-                if sd_key and sd_value and data_element[sd_key] == sd_value:
-                    return True
-                if sd_key and not sd_value and sd_key in data_element:
-                    return True
-                if not sd_key and not sd_value:
-                    return True
-
-            return False
+        data = self._extract(parser, sd_type)
 
+        if sd_type:
+            data_elements = data[sd_type]
+        else:
+            # data maps syntax name to its list of extracted elements
+            data_elements = (data_element for data_type in data.values() for data_element in data_type)
+
+        # hoist the key/value branching out of the loop so each element is tested against one predicate
+        if sd_key and sd_value:
+            def predicate(data_element):
+                return data_element.get(sd_key) == sd_value
+        elif sd_key:
+            def predicate(data_element):
+                return sd_key in data_element
         else:
-            for data_type in data:
-                for data_element in data_type:
-                    if sd_key and sd_value and data_element[sd_key] == sd_value:
-                        return True
-                    if sd_key and not sd_value and sd_key in data_element:
-                        return True
-                    if not sd_key and not sd_value:
-                        return True
+            def predicate(data_element):
+                return True
 
-            return False
+        return any(predicate(data_element) for data_element in data_elements)
 
 
 class PageCheck(Enum):
@@ -259,5 +365,9 @@ class PageCheck(Enum):
     STRUCTURED_DATA_FOUND = StructuredDataFoundCheck
 
 
+# check objects are stateless, so a shared instance per check type saves an allocation per invocation
+_CHECK_INSTANCES = {check: check.value() for check in PageCheck}
+
+
 def check_page(check: PageCheck, parser: AbstractPageParser, **kwargs):
-    return check.value().check_page(parser, **kwargs)
+    return _CHECK_INSTANCES[check].check_page(parser, **kwargs)
@@ -22,14 +22,43 @@ Todo:
 
 from enum import Enum
 import abc
-from collections import defaultdict
+from collections import Counter
 
 from seoaudit.analyzer.site_parser import SiteParser
 
 
+def _find_duplicates(parser: SiteParser, field: str):
+    """
+    Find metadata values repeated across the site's parsed pages.
+
+    sites_cache keeps one list per field, so the first Counter pass runs over a contiguous list of
+    values, and only the repeated ones allocate url lists in the second pass instead of building a full
+    value-to-pages mapping for every unique value.
+
+    Args:
+        parser (SiteParser): website parser object
+        field (str): sites_cache field to group pages by (e.g. 'title')
+
+    Returns:
+        dict : repeated field value to list of urls it appears on
+    """
+    values = parser.sites_cache[field]
+    counts = Counter(values)
+    duplicates = {value: [] for value, count in counts.items() if count > 1}
+
+    if duplicates:
+        for value, url in zip(values, parser.sites_cache['url']):
+            if value in duplicates:
+                duplicates[value].append(url)
+
+    return duplicates
+
+
 class AbstractSiteCheck(metaclass=abc.ABCMeta):
     """ Abstract class to be extended in element site classes. """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def check_site(self, parser: SiteParser, **kwargs):
         """ Returns check validity of the given site
@@ -45,6 +74,8 @@ class AbstractSiteCheck(metaclass=abc.ABCMeta):
 class SitemapFoundCheck(AbstractSiteCheck):
     """ Checks if site sitemap is found. """
 
+    __slots__ = ()
+
     def check_site(self, parser: SiteParser, **unused):
         """
         Args:
@@ -60,6 +91,8 @@ class SitemapFoundCheck(AbstractSiteCheck):
 class RobotsFoundCheck(AbstractSiteCheck):
     """ Checks if site robots file is found. """
 
+    __slots__ = ()
+
     def check_site(self, parser: SiteParser, **unused):
         """
         Args:
@@ -75,6 +108,8 @@ class RobotsFoundCheck(AbstractSiteCheck):
 class ManifestFoundCheck(AbstractSiteCheck):
     """ Checks if site web app manifest file is found. """
 
+    __slots__ = ()
+
     def check_site(self, parser: SiteParser, **unused):
         """
         Args:
@@ -90,6 +125,8 @@ class ManifestFoundCheck(AbstractSiteCheck):
 class BrowserConfigFoundCheck(AbstractSiteCheck):
     """ Checks if site browser config file is found. """
 
+    __slots__ = ()
+
     def check_site(self, parser: SiteParser, **unused):
         """
         Args:
@@ -105,6 +142,8 @@ class BrowserConfigFoundCheck(AbstractSiteCheck):
 class PageCrawlableCheck(AbstractSiteCheck):
     """ Checks if page is crawlable by site's robots settings. """
 
+    __slots__ = ()
+
     def check_site(self, parser: SiteParser, **unused):
         """
         Args:
@@ -129,6 +168,8 @@ class PageCrawlableCheck(AbstractSiteCheck):
 class PageInSitemapCheck(AbstractSiteCheck):
     """ Checks if page's url is found in site's sitemap. """
 
+    __slots__ = ()
+
     def check_site(self, parser: SiteParser, **unused):
         """
         Args:
@@ -138,14 +179,15 @@ class PageInSitemapCheck(AbstractSiteCheck):
             a boolean value representing checks validity
 
         """
-        return not all(
-            [(sitemap_url != parser.page_parser.url) and (sitemap_url != parser.page_parser.url + "/") for sitemap_url
-             in parser.sitemap_urls])
+        url = parser.page_parser.url
+        return url in parser.sitemap_urls_set or url + "/" in parser.sitemap_urls_set
 
 
 class TitleRepetitionCheck(AbstractSiteCheck):
     """ Checks if title metadata repetition across different pages. """
 
+    __slots__ = ()
+
     def check_site(self, parser: SiteParser, **unused):
         """
         Args:
@@ -155,13 +197,7 @@ class TitleRepetitionCheck(AbstractSiteCheck):
             a boolean value representing checks validity
 
         """
-        titles_list = [d['title'] for d in parser.sites_cache]
-        url_list = [d['url'] for d in parser.sites_cache]
-
-        titles_dict = defaultdict(list)
-        for i, item in enumerate(titles_list):
-            titles_dict[item].append(i)
-        titles_dict = {k: [url_list[v] for v in v] for k, v in titles_dict.items() if len(v) > 1}
+        titles_dict = _find_duplicates(parser, 'title')
         if len(titles_dict) > 0:
             return False, titles_dict
 
@@ -171,6 +207,8 @@ class TitleRepetitionCheck(AbstractSiteCheck):
 class DescriptionRepetitionCheck(AbstractSiteCheck):
     """ Checks if description metadata repetition across different pages. """
 
+    __slots__ = ()
+
     def check_site(self, parser: SiteParser, **unused):
         """
         Args:
@@ -180,13 +218,7 @@ class DescriptionRepetitionCheck(AbstractSiteCheck):
             a boolean value representing checks validity
 
         """
-        descriptions_list = [d['description'] for d in parser.sites_cache]
-        url_list = [d['url'] for d in parser.sites_cache]
-
-        descriptions_dict = defaultdict(list)
-        for i, item in enumerate(descriptions_list):
-            descriptions_dict[item].append(i)
-        descriptions_dict = {k: [url_list[v] for v in v] for k, v in descriptions_dict.items() if len(v) > 1}
+        descriptions_dict = _find_duplicates(parser, 'description')
         if len(descriptions_dict) > 0:
             return False, descriptions_dict
 
@@ -204,5 +236,9 @@ class SiteCheck(Enum):
     DESCRIPTION_REPETITION = DescriptionRepetitionCheck
 
 
+# check objects are stateless, so a shared instance per check type saves an allocation per invocation
+_CHECK_INSTANCES = {check: check.value() for check in SiteCheck}
+
+
 def check_site(check: SiteCheck, parser: SiteParser, **kwargs):
-    return check.value().check_site(parser, **kwargs)
+    return _CHECK_INSTANCES[check].check_site(parser, **kwargs)
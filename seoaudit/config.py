@@ -1,4 +1,7 @@
 #!/usr/bin/env python
+from lxml.etree import XPath
+
+from seoaudit.checks import element as element_checks
 from seoaudit.checks.element import ElementCheck
 from seoaudit.checks.page import PageCheck
 from seoaudit.checks.site import SiteCheck
@@ -22,26 +25,37 @@ page_tests = [(PageCheck.TEXT_TO_CODE_RATIO, {"min_ratio": 0.1}),
 
 # Todo: add regex check for charset = utf-8
 # Todo: add regex check for robots not block page
+# element queries are compiled once at import time so per-page evaluation skips xpath expression parsing
 element_tests = [
-    ("/html", 'lang'),
-    ("(/html/head/meta[@charset])", 'charset'),
-    ("/html/head/title", 'textContent',
+    (XPath("/html"), 'lang'),
+    (XPath("(/html/head/meta[@charset])"), 'charset'),
+    (XPath("/html/head/title"), 'textContent',
      [(ElementCheck.MIN_LENGTH, {"min_length": 40}),
       (ElementCheck.MAX_LENGTH, {"max_length": 70})]),
-    ("(/html/head/meta[@name='description'])", 'content',
+    (XPath("(/html/head/meta[@name='description'])"), 'content',
      [(ElementCheck.MIN_LENGTH, {"min_length": 50}), (ElementCheck.MAX_LENGTH, {"max_length": 160})]),
-    ("(/html/head/meta[@name='viewport'])", 'content'),
-    ("(//img)", 'alt'),
-    ("(//a[@href])", 'title'),
-    ("(/html/head/meta[@property='og:locale'])", 'content'),
-    ("(/html/head/meta[@property='og:title'])", 'content'),
-    ("(/html/head/meta[@property='og:description'])", 'content'),
-    ("(/html/head/meta[@property='og:type'])", 'content'),
-    ("(/html/head/meta[@property='og:url'])", 'content'),
-    ("(/html/head/meta[@property='og:image'])", 'content'),
-    ("(/html/head/meta[@name='twitter:title'])", 'content'),
-    ("(/html/head/meta[@name='twitter:description'])", 'content'),
-    ("(/html/head/meta[@name='twitter:image'])", 'content'),
-    ("(/html/head/meta[@name='twitter:card'])", 'content'),
-    ("(/html/head/link[@rel='canonical'])", 'href')
+    (XPath("(/html/head/meta[@name='viewport'])"), 'content'),
+    (XPath("(//img)"), 'alt'),
+    (XPath("(//a[@href])"), 'title'),
+    (XPath("(/html/head/meta[@property='og:locale'])"), 'content'),
+    (XPath("(/html/head/meta[@property='og:title'])"), 'content'),
+    (XPath("(/html/head/meta[@property='og:description'])"), 'content'),
+    (XPath("(/html/head/meta[@property='og:type'])"), 'content'),
+    (XPath("(/html/head/meta[@property='og:url'])"), 'content'),
+    (XPath("(/html/head/meta[@property='og:image'])"), 'content'),
+    (XPath("(/html/head/meta[@name='twitter:title'])"), 'content'),
+    (XPath("(/html/head/meta[@name='twitter:description'])"), 'content'),
+    (XPath("(/html/head/meta[@name='twitter:image'])"), 'content'),
+    (XPath("(/html/head/meta[@name='twitter:card'])"), 'content'),
+    (XPath("(/html/head/link[@rel='canonical'])"), 'href')
 ]
+
+# the config is static, so every regex the element checks will ever use is known here; pre-populate the
+# pattern caches at import time instead of paying compile latency on the first audited page
+for _test in element_tests:
+    for _check, _check_kwargs in (_test[2] if len(_test) > 2 else ()):
+        _regex = _check_kwargs.get('regex')
+        if _regex is not None:
+            element_checks._get_pattern(_regex)
+            if element_checks.hyperscan is not None:
+                element_checks._get_hyperscan_db(_regex)
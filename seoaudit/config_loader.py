@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+"""
+This module contains the loader for user supplied Python config files.
+
+Config files are resolved relative to the current working directory with os.path.join (cross-platform)
+and the loaded module object is cached keyed by path and modification time, so repeated loads of an
+unchanged config skip re-executing the file.
+
+Typical usage example:
+
+    from seoaudit.config_loader import load_config
+    cfg = load_config("my_config")
+    page_tests = cfg.page_tests
+
+"""
+
+import functools
+import importlib.util
+import os
+
+
+def load_config(name):
+    """
+    Load a Python config module found in the current working directory.
+
+    Args:
+        name (str): config module name without the .py extension
+
+    Returns:
+        module : loaded config module
+    """
+    path = os.path.join(os.getcwd(), name + '.py')
+    return _load_config_file(path, os.path.getmtime(path))
+
+
+@functools.lru_cache(maxsize=16)
+def _load_config_file(path, mtime):
+    """ Execute the config file on given path; mtime is part of the cache key so edits invalidate it. """
+    module_name = os.path.splitext(os.path.basename(path))[0]
+    module_spec = importlib.util.spec_from_file_location(module_name, path)
+    cfg = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(cfg)
+    return cfg
@@ -17,17 +17,19 @@ DESCRIPTION = 'Run SEO checks on a set of urls.'
 URL = 'https://github.com/Guber/seoaudit'
 EMAIL = 'emanuel.guberovic@gmail.com'
 AUTHOR = 'Emanuel Guberovic'
-REQUIRES_PYTHON = '>=3.6.0'
+REQUIRES_PYTHON = '>=3.7.0'
 VERSION = '0.0.1dev4'
 
 # What packages are required for this module to be executed?
 REQUIRED = [
-    'requests', 'lxml', 'nltk', 'extruct', 'selenium', 'json2html'
+    'requests', 'aiohttp', 'lxml', 'nltk', 'extruct', 'selenium', 'json2html'
 ]
 
 # What packages are optional?
 EXTRAS = {
     'selenium parser feature': ['selenium'],
+    'faster results serialization': ['orjson'],
+    'hyperscan regex matching': ['hyperscan'],
 }
 
 # The rest you shouldn't have to touch too much :)